@@ -11,19 +11,23 @@ from __future__ import annotations
 # ============================================================
 
 import os
-import json
+import glob
+import queue
+import atexit
+import gzip
+import hashlib
 import time
-import math
 import random
 import logging
+import logging.handlers
+import functools
+import threading
 from dataclasses import dataclass
-from typing import Dict, Any, List, Optional, Iterable, Tuple
+from typing import Dict, Any, List, Optional, Iterable, Set, Tuple
 from collections import defaultdict
 
-import requests
-from requests import Response, Session
-from requests.adapters import HTTPAdapter
-from urllib3.util.retry import Retry
+import httpx
+import orjson
 from dotenv import load_dotenv
 from concurrent.futures import ThreadPoolExecutor, as_completed
 
@@ -33,7 +37,9 @@ load_dotenv(dotenv_path="/config/.env")
 
 # ------------------------------------------------------------
 # Helpers: environment parsing
+# (memoized: env is fixed after load_dotenv; call .cache_clear() if you change it)
 # ------------------------------------------------------------
+@functools.lru_cache(maxsize=None)
 def get_env_bool(key: str, default: bool = False) -> bool:
     val = os.getenv(key)
     if val is None:
@@ -41,6 +47,7 @@ def get_env_bool(key: str, default: bool = False) -> bool:
     return str(val).strip().lower() in {"1", "true", "t", "yes", "y", "on"}
 
 
+@functools.lru_cache(maxsize=None)
 def get_env_int(key: str, default: int = 0) -> int:
     val = os.getenv(key)
     if val is None:
@@ -51,6 +58,7 @@ def get_env_int(key: str, default: int = 0) -> int:
         return default
 
 
+@functools.lru_cache(maxsize=None)
 def get_env_str(key: str, default: str = "") -> str:
     val = os.getenv(key)
     return str(val).strip() if val is not None else default
@@ -59,18 +67,74 @@ def get_env_str(key: str, default: str = "") -> str:
 # ------------------------------------------------------------
 # Logging
 # ------------------------------------------------------------
-LOG_FILE = f"/app/runtime/output_{time.strftime('%Y-%m-%d')}.log"
+LOG_FILE_PATTERN = "/app/runtime/output_{date}.log"
 LOG_LEVEL = get_env_str("LOG_LEVEL", "INFO").upper()
+LOG_RETENTION_DAYS = get_env_int("LOG_RETENTION_DAYS", 14)
+
+
+class DailyFileHandler(logging.FileHandler):
+    """
+    Append to output_YYYY-MM-DD.log and switch files when the local date changes.
+    Unlike TimedRotatingFileHandler it never renames files, so the cron job and the
+    long-running web service can log into the same directory without clobbering each other.
+    """
+
+    def __init__(self, pattern: str, retention_days: int = 0) -> None:
+        self.pattern = pattern
+        self.retention_days = retention_days
+        self.day = time.strftime("%Y-%m-%d")
+        super().__init__(pattern.format(date=self.day), encoding="utf-8", delay=True)
+
+    def emit(self, record: logging.LogRecord) -> None:
+        day = time.strftime("%Y-%m-%d", time.localtime(record.created))
+        if day != self.day:
+            self.day = day
+            self.close()  # reopened lazily by FileHandler.emit
+            self.baseFilename = os.path.abspath(self.pattern.format(date=day))
+            self._prune()
+        super().emit(record)
+
+    def _open(self):
+        stream = super()._open()
+        # Cron runs as root and the web service as polishrr; whichever creates the day's
+        # file must leave it appendable for the other (umask would make it 0644)
+        try:
+            os.chmod(self.baseFilename, 0o666)
+        except OSError:
+            pass  # created by the other process, which already opened it up
+        return stream
+
+    def _prune(self) -> None:
+        if self.retention_days <= 0:
+            return
+        cutoff = time.strftime("%Y-%m-%d", time.localtime(time.time() - self.retention_days * 86400))
+        prefix, suffix = self.pattern.split("{date}")
+        for path in glob.glob(self.pattern.format(date="*")):
+            if path[len(prefix):-len(suffix) or None] < cutoff:
+                try:
+                    os.remove(path)
+                except OSError:
+                    pass
+
+
+# Callers (including the parallel workers) only enqueue records; one background thread does the file I/O
+_LOG_QUEUE: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+_LOG_LISTENER = logging.handlers.QueueListener(
+    _LOG_QUEUE, DailyFileHandler(LOG_FILE_PATTERN, LOG_RETENTION_DAYS), respect_handler_level=True
+)
+_LOG_LISTENER.start()
+atexit.register(_LOG_LISTENER.stop)  # flushes queued records on exit
 
-logging.Formatter.converter = time.localtime
 logging.basicConfig(
-    filename=LOG_FILE,
-    encoding="utf-8",
+    handlers=[logging.handlers.QueueHandler(_LOG_QUEUE)],
     format="%(asctime)s [%(levelname)s] %(name)s :: %(message)s",
     datefmt="%Y-%m-%d %H:%M:%S",
     level=getattr(logging, LOG_LEVEL, logging.INFO),
 )
 logger = logging.getLogger("arr-backend")
+# httpx logs every request at INFO; keep that out of the run log unless debugging
+if logger.getEffectiveLevel() > logging.DEBUG:
+    logging.getLogger("httpx").setLevel(logging.WARNING)
 
 
 # ------------------------------------------------------------
@@ -85,9 +149,25 @@ RECENT_UPGRADES: Dict[str, List[dict]] = {"radarr": [], "sonarr": []}
 
 # HTTP tuning
 DEFAULT_TIMEOUT = float(get_env_str("HTTP_TIMEOUT_SECONDS", "15"))
+# Fail fast on unreachable hosts instead of waiting the full read timeout
+CONNECT_TIMEOUT = float(get_env_str("HTTP_CONNECT_TIMEOUT_SECONDS", "5"))
 MAX_RETRIES = get_env_int("HTTP_MAX_RETRIES", 3)
 BACKOFF_FACTOR = float(get_env_str("HTTP_BACKOFF_FACTOR", "0.5"))
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+HTTP2_ENABLED = get_env_bool("HTTP2_ENABLED", True)
 MAX_WORKERS = max(2, get_env_int("MAX_PARALLEL_REQUESTS", 8))
+# Global request rate cap for parallel fan-out (0 = unlimited)
+MAX_RPS = float(get_env_str("MAX_REQUESTS_PER_SECOND", "0"))
+# Number of ids per bulk lookup (keeps query strings well below URL limits)
+BULK_CHUNK_SIZE = max(1, get_env_int("BULK_CHUNK_SIZE", 100))
+# Records requested per /queue call (the API default of 20 silently truncates)
+QUEUE_PAGE_SIZE = max(1, get_env_int("QUEUE_PAGE_SIZE", 1000))
+# How long tag ids / quality profile cutoffs are reused before refetching
+METADATA_TTL = float(get_env_str("ARR_METADATA_TTL_SECONDS", "300"))
+# How long full /movie and /series snapshots are reused before revalidating
+COLLECTION_TTL = float(get_env_str("ARR_COLLECTION_TTL_SECONDS", "30"))
+# Where ETag'd collections and tag/quality profile lookups are kept between runs ("" disables)
+COLLECTION_CACHE_DIR = get_env_str("COLLECTION_CACHE_DIR", "/app/runtime/cache")
 
 
 # ------------------------------------------------------------
@@ -141,31 +221,50 @@ def load_app_config() -> AppConfig:
 # ------------------------------------------------------------
 class HttpClient:
     def __init__(self, headers: Optional[Dict[str, str]] = None) -> None:
-        self.session: Session = requests.Session()
-        retries = Retry(
-            total=MAX_RETRIES,
-            connect=MAX_RETRIES,
-            read=MAX_RETRIES,
-            status=MAX_RETRIES,
-            backoff_factor=BACKOFF_FACTOR,
-            allowed_methods=frozenset({"GET", "POST", "PUT", "DELETE"}),
-            status_forcelist=(429, 500, 502, 503, 504),
-            raise_on_status=False,
+        # HTTP/2 lets the parallel fan-out share one TLS connection (negotiated via ALPN on https)
+        self.session: httpx.Client = httpx.Client(
+            http2=HTTP2_ENABLED,
+            headers=headers or {},
+            timeout=httpx.Timeout(DEFAULT_TIMEOUT, connect=min(CONNECT_TIMEOUT, DEFAULT_TIMEOUT)),
+            # Keep at least one idle socket per parallel worker so fan-outs never re-handshake
+            limits=httpx.Limits(max_keepalive_connections=max(20, MAX_WORKERS), max_connections=max(100, MAX_WORKERS)),
+            follow_redirects=True,
         )
-        adapter = HTTPAdapter(max_retries=retries, pool_connections=20, pool_maxsize=50)
-        self.session.mount("http://", adapter)
-        self.session.mount("https://", adapter)
-        self.session.headers.update(headers or {})
+
+    def _send(self, method: str, url: str, **kwargs) -> httpx.Response:
+        """Send with exponential backoff on transport errors and retryable statuses."""
+        if "json" in kwargs:
+            # Encode bodies with orjson (full movie/series payloads on PUT) instead of stdlib json
+            kwargs["content"] = orjson.dumps(kwargs.pop("json"))
+            kwargs["headers"] = {**(kwargs.get("headers") or {}), "Content-Type": "application/json"}
+        attempt = 0
+        while True:
+            try:
+                resp = self.session.request(method, url, **kwargs)
+            except httpx.TransportError:
+                if attempt >= MAX_RETRIES:
+                    raise
+                delay = BACKOFF_FACTOR * (2 ** attempt)
+            else:
+                if resp.status_code not in RETRY_STATUSES or attempt >= MAX_RETRIES:
+                    return resp
+                retry_after = resp.headers.get("Retry-After", "")
+                delay = float(retry_after) if retry_after.isdigit() else BACKOFF_FACTOR * (2 ** attempt)
+            attempt += 1
+            time.sleep(delay)
 
     def _request(self, method: str, url: str, **kwargs) -> Any:
-        timeout = kwargs.pop("timeout", DEFAULT_TIMEOUT)
-        resp: Response = self.session.request(method, url, timeout=timeout, **kwargs)
-        # Raises HTTPError if 4xx/5xx
+        resp = self._send(method, url, **kwargs)
+        # Raises HTTPStatusError if 4xx/5xx
         resp.raise_for_status()
-        if not resp.text:
+        return self._decode(resp)
+
+    @staticmethod
+    def _decode(resp: httpx.Response) -> Any:
+        if not resp.content:
             return {}
         try:
-            return resp.json()
+            return orjson.loads(resp.content)
         except ValueError:
             # Sometimes some endpoints return plain text; fallback to text
             return resp.text
@@ -173,6 +272,28 @@ class HttpClient:
     def get(self, url: str, **kwargs) -> Any:
         return self._request("GET", url, **kwargs)
 
+    def get_with_etag(self, url: str, etag: Optional[str] = None, **kwargs) -> Tuple[Any, Optional[str], bool]:
+        """Conditional GET. Returns (data, etag, not_modified); data is None on 304."""
+        headers = dict(kwargs.pop("headers", None) or {})
+        if etag:
+            headers["If-None-Match"] = etag
+        resp = self._send("GET", url, headers=headers, **kwargs)
+        if resp.status_code == 304:
+            return None, etag, True
+        resp.raise_for_status()
+        logger.debug(
+            "GET %s: %s bytes on the wire, %s decoded (Content-Encoding=%s)",
+            url, resp.num_bytes_downloaded, len(resp.content), resp.headers.get("Content-Encoding", "identity"),
+        )
+        return self._decode(resp), resp.headers.get("ETag"), False
+
+    def prewarm(self, url: str) -> None:
+        """Open (or refresh) a pooled connection with one cheap request before a parallel fan-out."""
+        try:
+            self.session.get(url)
+        except httpx.HTTPError as e:
+            logger.debug("Connection prewarm for %s failed: %s", url, e)
+
     def post(self, url: str, **kwargs) -> Any:
         return self._request("POST", url, **kwargs)
 
@@ -195,15 +316,34 @@ class ArrClient:
 
         self.base = base_url.rstrip("/")
         self.api_path = api_path if api_path.startswith("/") else f"/{api_path}"
+        self._url_prefix = f"{self.base}{self.api_path.rstrip('/')}/"
         self.client = HttpClient(headers={"Authorization": api_key})
+        # Short-lived caches: label -> (fetched_at, tag_id), (fetched_at, profileId -> cutoff)
+        self._tag_cache: Dict[str, Tuple[float, int]] = {}
+        self._cutoff_cache: Optional[Tuple[float, Dict[int, int]]] = None
+        # resource -> (fetched_at, etag, payload)
+        self._collection_cache: Dict[str, Tuple[float, Optional[str], Any]] = {}
+        # Web endpoints and upgrade runs share clients; let only one thread refetch a collection
+        self._collection_lock = threading.Lock()
 
     # URL builder
     def _url(self, *parts: str) -> str:
-        joined = "/".join(p.strip("/") for p in parts if p)
-        return f"{self.base}{self.api_path}{joined}"
+        # Callers pass bare path segments (no leading/trailing slashes)
+        return self._url_prefix + "/".join(parts)
 
     # Common helpers
     def ensure_tag(self, label: str) -> int:
+        cached = self._tag_cache.get(label)
+        if cached and time.monotonic() - cached[0] < METADATA_TTL:
+            return cached[1]
+        tag_id = (self._load_disk_metadata("tag") or {}).get(label)
+        if tag_id is None:
+            tag_id = self._resolve_tag(label)
+            self._store_disk_cache("tag", {"saved_at": time.time(), "data": {label: tag_id}})
+        self._tag_cache[label] = (time.monotonic(), tag_id)
+        return tag_id
+
+    def _resolve_tag(self, label: str) -> int:
         tags = self.client.get(self._url("tag"))
         if isinstance(tags, dict) and "records" in tags:
             tags = tags["records"]
@@ -216,11 +356,95 @@ class ArrClient:
         return tag_id
 
     def quality_profiles_cutoff_scores(self) -> Dict[int, int]:
-        profiles = self.client.get(self._url("qualityprofile"))
-        return {int(p["id"]): int(p.get("cutoffFormatScore", 0)) for p in profiles}
-
-    def queue(self) -> List[dict]:
-        res = self.client.get(self._url("queue"))
+        cached = self._cutoff_cache
+        if cached and time.monotonic() - cached[0] < METADATA_TTL:
+            return cached[1]
+        saved = self._load_disk_metadata("qualityprofile")
+        if saved is not None:
+            scores = {int(pid): score for pid, score in saved.items()}
+        else:
+            profiles = self.client.get(self._url("qualityprofile"))
+            scores = {int(p["id"]): int(p.get("cutoffFormatScore", 0)) for p in profiles}
+            self._store_disk_cache("qualityprofile", {"saved_at": time.time(), "data": scores})
+        self._cutoff_cache = (time.monotonic(), scores)
+        return scores
+
+    def _get_collection(self, resource: str, ttl: float) -> Any:
+        """GET a collection, reusing the last copy for `ttl` seconds and revalidating via ETag."""
+        cached = self._collection_cache.get(resource)
+        if cached and time.monotonic() - cached[0] < ttl:
+            return cached[2]
+        with self._collection_lock:
+            # Another thread may have refreshed it while we waited
+            cached = self._collection_cache.get(resource)
+            if cached is None:
+                # Short-lived processes (cron) start cold: revalidate against the copy on disk
+                cached = self._load_disk_collection(resource)
+            elif time.monotonic() - cached[0] < ttl:
+                return cached[2]
+            etag = cached[1] if cached else None
+            data, new_etag, not_modified = self.client.get_with_etag(self._url(resource), etag)
+            if not_modified and cached:
+                data = cached[2]
+            elif new_etag:
+                self._store_disk_cache(resource, {"etag": new_etag, "data": data})
+            self._collection_cache[resource] = (time.monotonic(), new_etag, data)
+            return data
+
+    def _disk_cache_path(self, name: str) -> str:
+        host_key = hashlib.sha1(self._url_prefix.encode()).hexdigest()[:12]
+        return os.path.join(COLLECTION_CACHE_DIR, f"{name}_{host_key}.json.gz")
+
+    def _load_disk_cache(self, name: str) -> Optional[dict]:
+        if not COLLECTION_CACHE_DIR:
+            return None
+        try:
+            with gzip.open(self._disk_cache_path(name), "rb") as f:
+                return orjson.loads(f.read())
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            logger.debug("Ignoring unreadable %s cache: %s", name, e)
+            return None
+
+    def _load_disk_collection(self, resource: str) -> Optional[Tuple[float, Optional[str], Any]]:
+        doc = self._load_disk_cache(resource)
+        if not doc or "etag" not in doc:
+            return None
+        return float("-inf"), doc["etag"], doc["data"]
+
+    def _load_disk_metadata(self, name: str) -> Any:
+        """Payload saved by an earlier run if it is younger than METADATA_TTL, else None."""
+        doc = self._load_disk_cache(name)
+        if not doc or time.time() - doc.get("saved_at", 0) >= METADATA_TTL:
+            return None
+        return doc.get("data")
+
+    def _store_disk_cache(self, name: str, doc: dict) -> None:
+        if not COLLECTION_CACHE_DIR:
+            return
+        path = self._disk_cache_path(name)
+        try:
+            os.makedirs(COLLECTION_CACHE_DIR, exist_ok=True)
+            # Write-then-rename so the cron job and web service never read a partial file
+            tmp = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+            with gzip.open(tmp, "wb", compresslevel=1) as f:
+                f.write(orjson.dumps(doc, option=orjson.OPT_NON_STR_KEYS))
+            os.replace(tmp, path)
+        except OSError as e:
+            # Surface it: a silently unwritable cache dir would quietly disable the cache for this process
+            logger.warning("Could not persist %s cache: %s", name, e)
+
+    def _expire_collection(self, resource: str) -> None:
+        cached = self._collection_cache.get(resource)
+        if cached:
+            # Keep etag/payload for revalidation, but force the next read to hit the server
+            self._collection_cache[resource] = (float("-inf"), cached[1], cached[2])
+
+    def queue(self, **params: Any) -> List[dict]:
+        # The paged endpoint defaults to 20 records; ask for everything in one call
+        params.setdefault("pageSize", QUEUE_PAGE_SIZE)
+        res = self.client.get(self._url("queue"), params=params)
         if isinstance(res, dict) and "records" in res:
             return list(res["records"])
         if isinstance(res, list):
@@ -239,17 +463,52 @@ class Radarr(ArrClient):
     def movies(self) -> List[dict]:
         return self.client.get(self._url("movie"))
 
+    def movies_cached(self, ttl: float = COLLECTION_TTL) -> List[dict]:
+        return self._get_collection("movie", ttl)
+
     def movie(self, movie_id: int) -> dict:
         return self.client.get(self._url("movie", str(movie_id)))
 
     def movie_file(self, file_id: int) -> dict:
         return self.client.get(self._url("moviefile", str(file_id)))
 
+    def movie_files_bulk(self, file_ids: List[int]) -> List[dict]:
+        """Fetch many movie files using chunked `moviefile?movieFileIds=...` calls (in parallel)."""
+        url = self._url("moviefile")
+        chunks = [file_ids[i:i + BULK_CHUNK_SIZE] for i in range(0, len(file_ids), BULK_CHUNK_SIZE)]
+
+        def fetch(chunk: List[int]) -> Any:
+            return self.client.get(url, params=[("movieFileIds", fid) for fid in chunk])
+
+        # Large libraries need several chunks; they are independent, so don't pay their RTTs serially.
+        # Unlike parallel_map, a failed chunk raises (as the single-chunk path does) instead of
+        # silently dropping its movies from scoring.
+        if len(chunks) > 1:
+            futures = [_EXECUTOR.submit(_rate_limited, fetch, c) for c in chunks]
+            results = [fut.result() for fut in futures]
+        else:
+            results = [fetch(c) for c in chunks]
+        files: List[dict] = []
+        for res in results:
+            if isinstance(res, list):
+                files.extend(res)
+        return files
+
     def update_movie(self, movie: dict) -> dict:
+        self._expire_collection("movie")
         return self.client.put(self._url("movie", str(movie["id"])), json=movie)
 
+    def tag_movies(self, movie_ids: Iterable[int], tag_ids: Iterable[int], apply: str = "add") -> Any:
+        """Add/remove tags on many movies with a single movie editor request."""
+        self._expire_collection("movie")
+        return self.client.put(
+            self._url("movie", "editor"),
+            json={"movieIds": list(movie_ids), "tags": list(tag_ids), "applyTags": apply},
+        )
+
     def delete_movie_file(self, file_id: int) -> None:
         self.client.delete(self._url("moviefile", str(file_id)))
+        self._expire_collection("movie")
 
     def search_movies(self, movie_ids: Iterable[int]) -> Any:
         return self.command("MoviesSearch", movieIds=list(movie_ids))
@@ -259,82 +518,255 @@ class Radarr(ArrClient):
 # Sonarr client
 # ------------------------------------------------------------
 class Sonarr(ArrClient):
+    def __init__(self, base_url: str, api_key: str, api_path: str) -> None:
+        super().__init__(base_url, api_key, api_path)
+        # seriesId -> (fetched_at, episode files)
+        self._episode_files_cache: Dict[int, Tuple[float, List[dict]]] = {}
+        # Endpoints hit once per series in the parallel fan-outs
+        self._episodefile_url = self._url("episodefile")
+        self._episode_url = self._url("episode")
+
     def series_list(self) -> List[dict]:
         return self.client.get(self._url("series"))
 
+    def series_list_cached(self, ttl: float = COLLECTION_TTL) -> List[dict]:
+        return self._get_collection("series", ttl)
+
     def series(self, series_id: int) -> dict:
         return self.client.get(self._url("series", str(series_id)))
 
     def update_series(self, series: dict) -> dict:
+        self._expire_collection("series")
         return self.client.put(self._url("series", str(series["id"])), json=series)
 
+    def tag_series(self, series_ids: Iterable[int], tag_ids: Iterable[int], apply: str = "add") -> Any:
+        """Add/remove tags on many series with a single series editor request."""
+        self._expire_collection("series")
+        return self.client.put(
+            self._url("series", "editor"),
+            json={"seriesIds": list(series_ids), "tags": list(tag_ids), "applyTags": apply},
+        )
+
     def episode_file_list(self, series_id: int) -> List[dict]:
-        return self.client.get(self._url("episodefile"), params={"seriesId": series_id})
+        return self.client.get(self._episodefile_url, params={"seriesId": series_id})
+
+    def episode_files_by_series(self, series_ids: Iterable[int], ttl: float = COLLECTION_TTL) -> Dict[int, List[dict]]:
+        """
+        Return seriesId -> episode files via per-series lookups in parallel. Results are cached
+        for `ttl`. (Sonarr v3/v4 reject an unfiltered GET /episodefile, so there is no bulk path.)
+        """
+        now = time.monotonic()
+        out: Dict[int, List[dict]] = {}
+        missing: List[int] = []
+        for sid in set(series_ids):
+            cached = self._episode_files_cache.get(sid)
+            if cached and now - cached[0] < ttl:
+                out[sid] = cached[1]
+            else:
+                missing.append(sid)
+        if not missing:
+            return out
+
+        def fetch(sid: int) -> Tuple[int, List[dict]]:
+            return sid, self.episode_file_list(sid)
+
+        if len(missing) > 1:
+            self.client.prewarm(self._url("system", "status"))
+        for sid, files in parallel_map(fetch, missing):
+            self._episode_files_cache[sid] = (time.monotonic(), files)
+            out[sid] = files
+        return out
 
     def episode(self, episode_id: int) -> dict | List[dict]:
         return self.client.get(self._url("episode", str(episode_id)))
 
+    def episodes_for_series(self, series_id: int) -> List[dict]:
+        res = self.client.get(self._episode_url, params={"seriesId": series_id})
+        return res if isinstance(res, list) else []
+
     def delete_episode_file(self, file_id: int) -> None:
         self.client.delete(self._url("episodefile", str(file_id)))
+        # Evict the series that listed this file so status views stop reporting its old score
+        for sid, (_, files) in list(self._episode_files_cache.items()):
+            if any(epf.get("id") == file_id for epf in files):
+                self._episode_files_cache.pop(sid, None)
 
     def search_episodes(self, episode_ids: Iterable[int]) -> Any:
         return self.command("EpisodeSearch", episodeIds=list(episode_ids))
 
 
+# ------------------------------------------------------------
+# Client cache (reuse sessions/keep-alive sockets across calls)
+# ------------------------------------------------------------
+@functools.lru_cache(maxsize=8)
+def _get_radarr(base_url: str, api_key: str, api_path: str) -> Radarr:
+    return Radarr(base_url, api_key, api_path)
+
+
+@functools.lru_cache(maxsize=8)
+def _get_sonarr(base_url: str, api_key: str, api_path: str) -> Sonarr:
+    return Sonarr(base_url, api_key, api_path)
+
+
 # ------------------------------------------------------------
 # Performance helpers
 # ------------------------------------------------------------
-def parallel_map(func, items: Iterable[Any], max_workers: int = MAX_WORKERS) -> List[Any]:
-    """Parallel map with bounded threads + graceful failures."""
+_EXECUTOR = ThreadPoolExecutor(max_workers=MAX_WORKERS, thread_name_prefix="arr-io")
+_RATE = threading.Semaphore(MAX_WORKERS)
+_MIN_INTERVAL = 1.0 / MAX_RPS if MAX_RPS > 0 else 0.0
+_SLOT_LOCK = threading.Lock()
+_next_slot = 0.0
+
+
+def _sleep_until_next_slot() -> None:
+    """Space task starts at least _MIN_INTERVAL apart (process-wide)."""
+    global _next_slot
+    if _MIN_INTERVAL <= 0:
+        return
+    with _SLOT_LOCK:
+        now = time.monotonic()
+        wait = _next_slot - now
+        _next_slot = max(now, _next_slot) + _MIN_INTERVAL
+    if wait > 0:
+        time.sleep(wait)
+
+
+def _rate_limited(func, item: Any) -> Any:
+    with _RATE:
+        _sleep_until_next_slot()
+        return func(item)
+
+
+def add_tag(item: dict, tag_id: int) -> dict:
+    """
+    Set item["tags"] to a new list including tag_id and return item.
+    The item itself is updated, so pass a private copy (dict(record) is enough, the
+    tags list is replaced rather than appended to) for records from the collection cache.
+    """
+    tags = item.get("tags") or []
+    if tag_id not in tags:
+        tags = [*tags, tag_id]
+    item["tags"] = tags
+    return item
+
+
+def remove_tag(item: dict, tag_id: int) -> dict:
+    """Set item["tags"] to a new list without tag_id; same copy rule as add_tag."""
+    item["tags"] = [t for t in (item.get("tags") or ()) if t != tag_id]
+    return item
+
+
+def pick_random(items: Dict[int, Any], k: int) -> List[int]:
+    """Pick up to k keys at random; skips sampling when every key is taken anyway."""
+    if k >= len(items):
+        return list(items)
+    if k <= 0:
+        return []
+    # Reservoir sampling (Algorithm R): one pass over the keys without copying them into a list
+    reservoir: List[int] = []
+    randrange = random.randrange
+    for i, key in enumerate(items):
+        if i < k:
+            reservoir.append(key)
+        else:
+            j = randrange(i + 1)
+            if j < k:
+                reservoir[j] = key
+    return reservoir
+
+
+def parallel_map(func, items: Iterable[Any]) -> List[Any]:
+    """Parallel map on the shared, rate-limited pool + graceful failures.
+
+    Must not be called from inside a task already running on the pool.
+    """
     results: List[Any] = []
-    with ThreadPoolExecutor(max_workers=max_workers) as pool:
-        future_map = {pool.submit(func, item): item for item in items}
-        for fut in as_completed(future_map):
-            try:
-                results.append(fut.result())
-            except Exception as e:
-                logger.warning("Parallel task failed for %r: %s", future_map[fut], e)
+    future_map = {_EXECUTOR.submit(_rate_limited, func, item): item for item in items}
+    for fut in as_completed(future_map):
+        try:
+            results.append(fut.result())
+        except Exception as e:
+            logger.warning("Parallel task failed for %r: %s", future_map[fut], e)
     return results
 
 
+# ------------------------------------------------------------
+# Upgrade candidates
+# ------------------------------------------------------------
+@dataclass(slots=True)
+class Candidate:
+    """An item below its cutoff score that may be selected for upgrade."""
+    title: str
+    current_score: int
+    required_score: int
+    series_id: Optional[int] = None  # Sonarr only
+
+
 # ------------------------------------------------------------
 # Radarr logic
 # ------------------------------------------------------------
-def collect_radarr_upgrade_candidates(rad: Radarr, tag_id: int) -> Dict[int, Dict[str, Any]]:
-    """Return movieId -> info for items below cutoff and not tagged."""
+def fetch_radarr_scores(rad: Radarr, movies: List[dict]) -> Dict[int, int]:
+    """Return movieId -> current customFormatScore, resolved via bulk moviefile lookups."""
+    # Radarr ids/scores are already JSON ints, so no int() coercion in these loops
+    files = rad.movie_files_bulk([m["movieFileId"] for m in movies])
+    file_by_id = {mf["id"]: mf for mf in files}
+    get_file = file_by_id.get
+    return {
+        m["id"]: mf.get("customFormatScore") or 0
+        for m in movies
+        if (mf := get_file(m["movieFileId"])) is not None
+    }
+
+
+def radarr_score_rows(
+    rad: Radarr, movies: List[dict], q_scores: Dict[int, int], tag_id: int
+) -> List[Tuple[int, str, int, int, bool]]:
+    """Return (id, title, score, cutoff, tagged) for every movie whose file could be resolved."""
+    scores = fetch_radarr_scores(rad, movies)
+    cutoff_for = q_scores.get
+    rows: List[Tuple[int, str, int, int, bool]] = []
+    for m in movies:
+        mid = m["id"]
+        score = scores.get(mid)
+        if score is None:
+            continue
+        rows.append((mid, m["title"], score, cutoff_for(m["qualityProfileId"], 0), tag_id in (m.get("tags") or ())))
+    return rows
+
+
+@dataclass(frozen=True)
+class RadarrSnapshot:
+    """Library state shared by the upgrade cycle and the status endpoints."""
+    tag_id: int
+    movies: List[dict]
+    # (id, title, score, cutoff, tagged) for monitored movies with a resolvable file
+    rows: List[Tuple[int, str, int, int, bool]]
+
+
+def snapshot_radarr(rad: Radarr, tag_id: int) -> RadarrSnapshot:
     q_scores = rad.quality_profiles_cutoff_scores()
-    movies = [m for m in rad.movies() if m.get("monitored") and m.get("movieFileId")]
+    movies = rad.movies_cached()
+    with_files = [m for m in movies if m.get("monitored") and m.get("movieFileId")]
+    return RadarrSnapshot(tag_id, movies, radarr_score_rows(rad, with_files, q_scores, tag_id))
 
-    # Fetch current scores in parallel (bottleneck in original)
-    def fetch_score(m: dict) -> Tuple[int, int, str]:
-        mf = rad.movie_file(int(m["movieFileId"]))
-        return int(m["id"]), int(mf.get("customFormatScore", 0)), str(m.get("title", ""))
 
-    fetched: List[Tuple[int, int, str]] = parallel_map(fetch_score, movies)
+def collect_radarr_upgrade_candidates(
+    rad: Radarr, tag_id: int, snapshot: Optional[RadarrSnapshot] = None
+) -> Dict[int, Candidate]:
+    """Return movieId -> info for items below cutoff and not tagged."""
+    snapshot = snapshot or snapshot_radarr(rad, tag_id)
 
-    candidates: Dict[int, Dict[str, Any]] = {}
+    candidates: Dict[int, Candidate] = {}
     tagged = 0
-    for m in movies:
-        mid = int(m["id"])
-        profile_id = int(m.get("qualityProfileId"))
-        cutoff = int(q_scores.get(profile_id, 0))
-        is_tagged = tag_id in m.get("tags", [])
+    for mid, title, current, cutoff, is_tagged in snapshot.rows:
         if is_tagged:
             tagged += 1
-        tup = next((t for t in fetched if t[0] == mid), None)
-        if not tup:
-            continue
-        _, current, title = tup
-        if current < cutoff and not is_tagged:
-            candidates[mid] = {
-                "title": title,
-                "currentScore": current,
-                "requiredScore": cutoff,
-            }
+        elif current < cutoff:
+            candidates[mid] = Candidate(title, current, cutoff)
 
     logger.info(
         "Radarr: movies=%s below_cutoff_unTagged=%s already_tagged=%s",
-        len(movies), len(candidates), tagged
+        len(snapshot.rows), len(candidates), tagged
     )
     return candidates
 
@@ -343,41 +775,57 @@ def run_radarr_upgrade(cfg: AppConfig) -> None:
     if not cfg.radarr.enabled:
         logger.info("Radarr disabled (PROCESS_RADARR=False)")
         return
+    if cfg.radarr.num_to_upgrade <= 0:
+        logger.info("NUM_MOVIES_TO_UPGRADE is %s, skipping Radarr cycle", cfg.radarr.num_to_upgrade)
+        return
 
     logger.info("Starting Radarr upgrade cycle...")
-    rad = Radarr(cfg.radarr.base_url, cfg.radarr.api_key, cfg.api_path)
+    rad = _get_radarr(cfg.radarr.base_url, cfg.radarr.api_key, cfg.api_path)
     tag_id = rad.ensure_tag(cfg.tag_name)
 
-    movies = rad.movies()
+    snapshot = snapshot_radarr(rad, tag_id)
+    movies = snapshot.movies
     if not movies:
         logger.info("Radarr returned 0 movies.")
         return
 
     # If all movies have the tag, remove it to restart the cycle
-    if all(tag_id in (m.get("tags", []) or []) for m in movies):
+    if all(tag_id in (m.get("tags") or ()) for m in movies):
         logger.info("All movies have the upgrade tag. Removing to restart cycle...")
-        for m in movies:
-            m["tags"] = [t for t in m.get("tags", []) if t != tag_id]
-            rad.update_movie(m)
+        try:
+            rad.tag_movies([int(m["id"]) for m in movies], [tag_id], "remove")
+        except httpx.HTTPError as e:
+            logger.warning("Radarr movie editor failed (%s); removing tags individually.", e)
+
+            def untag(m: dict) -> dict:
+                # Copy: `movies` is the cached collection and must keep mirroring the server
+                return rad.update_movie(remove_tag(dict(m), tag_id))
+
+            rad.client.prewarm(rad._url("system", "status"))
+            parallel_map(untag, movies)
         logger.info("Upgrade tag removed from all movies.")
         return
 
-    candidates = collect_radarr_upgrade_candidates(rad, tag_id)
+    candidates = collect_radarr_upgrade_candidates(rad, tag_id, snapshot)
     if not candidates:
         logger.info("No Radarr movies found for upgrade.")
         return
 
-    k = min(cfg.radarr.num_to_upgrade, len(candidates))
-    selected_ids = random.sample(list(candidates.keys()), k=k)
+    selected_ids = pick_random(candidates, cfg.radarr.num_to_upgrade)
     logger.info("Radarr selected movie IDs for upgrade: %s", selected_ids)
 
     RECENT_UPGRADES["radarr"].clear()
+    try:
+        rad.tag_movies(selected_ids, [tag_id], "add")
+    except httpx.HTTPError as e:
+        logger.warning("Radarr movie editor failed (%s); tagging movies individually.", e)
+        movies_by_id = {int(m["id"]): m for m in movies}
+        for mid in selected_ids:
+            rad.update_movie(add_tag(dict(movies_by_id[mid]), tag_id))
+
     for mid in selected_ids:
-        m = rad.movie(mid)
-        m["tags"] = sorted(set(m.get("tags", [])) | {tag_id})
-        rad.update_movie(m)
-        RECENT_UPGRADES["radarr"].append({"id": mid, "title": candidates[mid]["title"]})
-        logger.info("Tagged movie '%s' with '%s'", candidates[mid]["title"], cfg.tag_name)
+        RECENT_UPGRADES["radarr"].append({"id": mid, "title": candidates[mid].title})
+        logger.info("Tagged movie '%s' with '%s'", candidates[mid].title, cfg.tag_name)
 
     rad.search_movies(selected_ids)
     logger.info("Triggered Radarr MoviesSearch.")
@@ -386,33 +834,50 @@ def run_radarr_upgrade(cfg: AppConfig) -> None:
 # ------------------------------------------------------------
 # Sonarr logic
 # ------------------------------------------------------------
-def collect_sonarr_upgrade_candidates(son: Sonarr, tag_id: int) -> Dict[int, Dict[str, Any]]:
+def fetch_series_episode_files(son: Sonarr, series: List[dict]) -> List[Tuple[dict, List[dict]]]:
+    """Pair each series with its episode files; series that fail are logged and skipped."""
+    files_by_series = son.episode_files_by_series(int(s["id"]) for s in series)
+    return [(s, files_by_series[int(s["id"])]) for s in series if int(s["id"]) in files_by_series]
+
+
+@dataclass(frozen=True)
+class SonarrSnapshot:
+    """Library state shared by the upgrade cycle and the status endpoints."""
+    tag_id: int
+    quality_scores: Dict[int, int]
+    series: List[dict]
+
+
+def snapshot_sonarr(son: Sonarr, tag_id: int) -> SonarrSnapshot:
+    # Episode files are resolved per caller via Sonarr.episode_files_by_series (cached per series),
+    # since the upgrade cycle only needs files for untagged series.
+    return SonarrSnapshot(tag_id, son.quality_profiles_cutoff_scores(), son.series_list_cached())
+
+
+def collect_sonarr_upgrade_candidates(
+    son: Sonarr, tag_id: int, snapshot: Optional[SonarrSnapshot] = None
+) -> Dict[int, Candidate]:
     """
     Return episodeId -> info for episodes below cutoff where the SERIES is not tagged.
     To reduce calls, we fetch all episode files per series and compute locally.
     """
-    q_scores = son.quality_profiles_cutoff_scores()
-    series_list = son.series_list()
-    candidates: Dict[int, Dict[str, Any]] = {}
-
-    for serie in series_list:
-        profile_id = int(serie.get("qualityProfileId"))
-        cutoff = int(q_scores.get(profile_id, 0))
-        if int(serie.get("statistics", {}).get("episodeFileCount", 0)) == 0:
-            continue
-
-        is_series_tagged = tag_id in (serie.get("tags", []) or [])
-        if is_series_tagged:
-            # If the series is already tagged for upgrade, skip adding more
-            continue
-
+    snapshot = snapshot or snapshot_sonarr(son, tag_id)
+    q_scores = snapshot.quality_scores
+    series_list = snapshot.series
+    candidates: Dict[int, Candidate] = {}
+
+    # If the series is already tagged for upgrade, skip adding more
+    eligible_series = [
+        serie for serie in series_list
+        if int(serie.get("statistics", {}).get("episodeFileCount", 0)) > 0
+        and tag_id not in (serie.get("tags") or ())
+    ]
+
+    cutoff_for = q_scores.get
+    for serie, episode_files in fetch_series_episode_files(son, eligible_series):
         series_id = int(serie["id"])
-        try:
-            episode_files = son.episode_file_list(series_id)
-        except Exception as e:
-            logger.warning("Failed to fetch episode files for series %s: %s", series_id, e)
-            continue
-
+        series_title = serie.get("title", "Series")
+        cutoff = int(cutoff_for(int(serie.get("qualityProfileId")), 0))
         for epf in episode_files:
             current = int(epf.get("customFormatScore", 0))
             if current < cutoff:
@@ -420,12 +885,12 @@ def collect_sonarr_upgrade_candidates(son: Sonarr, tag_id: int) -> Dict[int, Dic
                 # We'll probe episode endpoint by episodeFileId to find an "episode"
                 # In many deployments `GET /episode?episodeFileId=...` returns a list; here we emulate with /episode/<id> path fallback from caller side.
                 # We can't rely on that being cheap, so we avoid it here. We'll still mark candidate using episodefile id.
-                candidates[int(epf["id"])] = {
-                    "title": f"{serie.get('title', 'Series')} (EpisodeFile {epf['id']})",
-                    "seriesId": series_id,
-                    "currentScore": current,
-                    "requiredScore": cutoff,
-                }
+                candidates[int(epf["id"])] = Candidate(
+                    title=f"{series_title} (EpisodeFile {epf['id']})",
+                    current_score=current,
+                    required_score=cutoff,
+                    series_id=series_id,
+                )
 
     logger.info(
         "Sonarr: series=%s below_cutoff_unTagged_episodeFiles=%s",
@@ -438,51 +903,61 @@ def run_sonarr_upgrade(cfg: AppConfig) -> None:
     if not cfg.sonarr.enabled:
         logger.info("Sonarr disabled (PROCESS_SONARR=False)")
         return
+    if cfg.sonarr.num_to_upgrade <= 0:
+        logger.info("NUM_EPISODES_TO_UPGRADE is %s, skipping Sonarr cycle", cfg.sonarr.num_to_upgrade)
+        return
 
     logger.info("Starting Sonarr upgrade cycle...")
-    son = Sonarr(cfg.sonarr.base_url, cfg.sonarr.api_key, cfg.api_path)
+    son = _get_sonarr(cfg.sonarr.base_url, cfg.sonarr.api_key, cfg.api_path)
     tag_id = son.ensure_tag(cfg.tag_name)
 
-    candidates = collect_sonarr_upgrade_candidates(son, tag_id)
+    snapshot = snapshot_sonarr(son, tag_id)
+    candidates = collect_sonarr_upgrade_candidates(son, tag_id, snapshot)
     if not candidates:
         logger.info("No Sonarr episodes found for upgrade.")
         return
 
-    k = min(cfg.sonarr.num_to_upgrade, len(candidates))
-    selected_ids = random.sample(list(candidates.keys()), k=k)
+    selected_ids = pick_random(candidates, cfg.sonarr.num_to_upgrade)
     logger.info("Sonarr selected episodeFile-based IDs for upgrade: %s", selected_ids)
 
+    # Several selected files may share a series; tag each affected series once
+    series_by_id = {s["id"]: s for s in snapshot.series}
+    tagged_series: Set[int] = {candidates[ep_id].series_id for ep_id in selected_ids}
+
     RECENT_UPGRADES["sonarr"].clear()
-    for ep_id in selected_ids:
-        series_id = int(candidates[ep_id]["seriesId"])
-        serie = son.series(series_id)
-        serie["tags"] = sorted(set(serie.get("tags", [])) | {tag_id})
-        son.update_series(serie)
+    try:
+        son.tag_series(tagged_series, [tag_id], "add")
+    except httpx.HTTPError as e:
+        logger.warning("Sonarr series editor failed (%s); tagging series individually.", e)
+        for series_id in tagged_series:
+            # Reuse the series snapshot from candidate collection instead of re-GETting each series
+            serie = dict(series_by_id.get(series_id) or son.series(series_id))
+            son.update_series(add_tag(serie, tag_id))
 
+    for ep_id in selected_ids:
+        series_id = candidates[ep_id].series_id
         RECENT_UPGRADES["sonarr"].append({
             "id": ep_id,
-            "title": candidates[ep_id]["title"],
+            "title": candidates[ep_id].title,
             "seriesId": series_id,
         })
-        logger.info("Tagged series '%s' for episodeFile %s with '%s'", serie.get("title"), ep_id, UPGRADE_TAG)
+        series_title = (series_by_id.get(series_id) or {}).get("title", series_id)
+        logger.info("Tagged series '%s' for episodeFile %s with '%s'", series_title, ep_id, UPGRADE_TAG)
 
     # Instruct Sonarr to search by episodes: we need episode IDs, not episodeFile IDs.
-    # We best-effort map episodeFile -> episodeId via GET /episode?episodeFileId=...
-    def episode_ids_for_episodefile(eid: int) -> List[int]:
-        try:
-            res = son.client.get(son._url("episode"), params={"episodeFileId": eid})
-            if isinstance(res, list) and res:
-                return [int(x["id"]) for x in res]
-            if isinstance(res, dict) and "id" in res:
-                return [int(res["id"])]
-        except Exception as e:
-            logger.warning("Failed to resolve episode IDs for episodeFile %s: %s", eid, e)
-        return []
+    # Map episodeFile -> episodeIds with one GET /episode?seriesId=... per affected series.
+    selected = set(selected_ids)
+
+    by_file_id: Dict[int, List[int]] = defaultdict(list)
+    if len(tagged_series) > 1:
+        son.client.prewarm(son._url("system", "status"))
+    for episodes in parallel_map(son.episodes_for_series, tagged_series):
+        for ep in episodes:
+            file_id = int(ep.get("episodeFileId") or 0)
+            if file_id in selected:
+                by_file_id[file_id].append(int(ep["id"]))
 
-    all_episode_ids: List[int] = []
-    for epf_id in selected_ids:
-        all_episode_ids.extend(episode_ids_for_episodefile(epf_id))
-    all_episode_ids = sorted(set(all_episode_ids))
+    all_episode_ids = sorted({eid for epf_id in selected_ids for eid in by_file_id.get(epf_id, [])})
 
     if all_episode_ids:
         son.search_episodes(all_episode_ids)
@@ -508,32 +983,16 @@ def get_upgrade_status(detailed: bool = False) -> dict:
     # Radarr
     try:
         if cfg.radarr.enabled:
-            rad = Radarr(cfg.radarr.base_url, cfg.radarr.api_key, cfg.api_path)
-            tag_id = rad.ensure_tag(cfg.tag_name)
-            q_scores = rad.quality_profiles_cutoff_scores()
-            movies = [m for m in rad.movies() if m.get("monitored") and m.get("movieFileId")]
-
-            def fetch_tuple(m: dict) -> Tuple[int, str, int, int, bool]:
-                mf = rad.movie_file(int(m["movieFileId"]))
-                score = int(mf.get("customFormatScore", 0))
-                cutoff = int(q_scores.get(int(m["qualityProfileId"]), 0))
-                tagged = tag_id in (m.get("tags", []) or [])
-                return int(m["id"]), str(m.get("title", "")), score, cutoff, tagged
-
-            fetched = parallel_map(fetch_tuple, movies)
-            for mid, title, score, cutoff, tagged in fetched:
-                if score < cutoff:
-                    status["radarr"]["total_below_cutoff"] += 1
-                    if not tagged:
-                        status["radarr"]["eligible_for_upgrade"] += 1
-                if detailed:
-                    status["radarr"]["items"].append({
-                        "id": mid,
-                        "title": title,
-                        "score": score,
-                        "cutoff": cutoff,
-                        "tagged": tagged,
-                    })
+            rad = _get_radarr(cfg.radarr.base_url, cfg.radarr.api_key, cfg.api_path)
+            fetched = snapshot_radarr(rad, rad.ensure_tag(cfg.tag_name)).rows
+            below = [t for t in fetched if t[2] < t[3]]
+            status["radarr"]["total_below_cutoff"] = len(below)
+            status["radarr"]["eligible_for_upgrade"] = sum(1 for t in below if not t[4])
+            if detailed:
+                status["radarr"]["items"] = [
+                    {"id": mid, "title": title, "score": score, "cutoff": cutoff, "tagged": tagged}
+                    for mid, title, score, cutoff, tagged in fetched
+                ]
             logger.info(
                 "Radarr stats: below=%s eligible=%s",
                 status["radarr"]["total_below_cutoff"], status["radarr"]["eligible_for_upgrade"]
@@ -547,19 +1006,19 @@ def get_upgrade_status(detailed: bool = False) -> dict:
     # Sonarr
     try:
         if cfg.sonarr.enabled:
-            son = Sonarr(cfg.sonarr.base_url, cfg.sonarr.api_key, cfg.api_path)
-            tag_id = son.ensure_tag(cfg.tag_name)
-            q_scores = son.quality_profiles_cutoff_scores()
-            series_list = son.series_list()
+            son = _get_sonarr(cfg.sonarr.base_url, cfg.sonarr.api_key, cfg.api_path)
+            snapshot = snapshot_sonarr(son, son.ensure_tag(cfg.tag_name))
+            tag_id, q_scores = snapshot.tag_id, snapshot.quality_scores
+
+            with_files = [
+                serie for serie in snapshot.series
+                if int(serie.get("statistics", {}).get("episodeFileCount", 0)) > 0
+            ]
 
-            for serie in series_list:
+            for serie, episode_files in fetch_series_episode_files(son, with_files):
                 profile_id = int(serie.get("qualityProfileId"))
                 cutoff = int(q_scores.get(profile_id, 0))
-                series_tagged = tag_id in (serie.get("tags", []) or [])
-                if int(serie.get("statistics", {}).get("episodeFileCount", 0)) == 0:
-                    continue
-
-                episode_files = son.episode_file_list(int(serie["id"]))
+                series_tagged = tag_id in (serie.get("tags") or ())
                 for epf in episode_files:
                     score = int(epf.get("customFormatScore", 0))
                     if score < cutoff:
@@ -589,6 +1048,14 @@ def get_upgrade_status(detailed: bool = False) -> dict:
     return status
 
 
+_BYTES_PER_GIB = 1 << 30
+
+
+def _gib(n: Optional[float]) -> float:
+    # API consumers (and the dashboard's size column) show this value as-is
+    return round((n or 0) / _BYTES_PER_GIB, 2)
+
+
 def get_download_queue(tagged_only: bool = False) -> dict:
     """
     Return current Radarr & Sonarr download queues with status info.
@@ -606,8 +1073,8 @@ def get_download_queue(tagged_only: bool = False) -> dict:
     # RADARR
     try:
         if cfg.radarr.enabled:
-            rad = Radarr(cfg.radarr.base_url, cfg.radarr.api_key, cfg.api_path)
-            items = rad.queue()
+            rad = _get_radarr(cfg.radarr.base_url, cfg.radarr.api_key, cfg.api_path)
+            items = rad.queue(includeUnknownMovieItems="false")
             for item in items:
                 if not isinstance(item, dict):
                     continue
@@ -615,8 +1082,8 @@ def get_download_queue(tagged_only: bool = False) -> dict:
                     "title": item.get("title"),
                     "status": item.get("status"),
                     "protocol": item.get("protocol"),
-                    "size": round(float(item.get("size", 0)) / (1024 ** 3), 2),
-                    "sizeleft": round(float(item.get("sizeleft", 0)) / (1024 ** 3), 2),
+                    "size": _gib(item.get("size")),
+                    "sizeleft": _gib(item.get("sizeleft")),
                     "timeleft": item.get("timeleft"),
                     "errorMessage": item.get("errorMessage"),
                     "indexer": item.get("indexer"),
@@ -629,11 +1096,23 @@ def get_download_queue(tagged_only: bool = False) -> dict:
     # SONARR
     try:
         if cfg.sonarr.enabled:
-            son = Sonarr(cfg.sonarr.base_url, cfg.sonarr.api_key, cfg.api_path)
+            son = _get_sonarr(cfg.sonarr.base_url, cfg.sonarr.api_key, cfg.api_path)
             tag_id = son.ensure_tag(cfg.tag_name)
-            items = son.queue()
+            items = son.queue(includeSeries="true", includeEpisode="true")
+
+            # Series come embedded in the queue records; fetch only what is missing,
+            # concurrently, and fall back to a placeholder on failure
+            series_cache: Dict[int, dict] = {
+                int(item["seriesId"]): item["series"]
+                for item in items
+                if isinstance(item, dict) and item.get("seriesId") and isinstance(item.get("series"), dict)
+            }
+            missing_ids = {
+                int(item["seriesId"]) for item in items
+                if isinstance(item, dict) and item.get("seriesId") and int(item["seriesId"]) not in series_cache
+            }
+            series_cache.update(parallel_map(lambda sid: (sid, son.series(sid)), missing_ids))
 
-            series_cache: Dict[int, dict] = {}
             for item in items:
                 if not isinstance(item, dict):
                     continue
@@ -641,15 +1120,8 @@ def get_download_queue(tagged_only: bool = False) -> dict:
                 if not series_id:
                     continue
 
-                if series_id not in series_cache:
-                    try:
-                        series_cache[series_id] = son.series(int(series_id))
-                    except Exception as e:
-                        logger.warning("Failed to fetch Sonarr series %s: %s", series_id, e)
-                        series_cache[series_id] = {"title": f"Series {series_id}", "tags": []}
-
-                serie = series_cache[series_id]
-                if tagged_only and tag_id not in (serie.get("tags", []) or []):
+                serie = series_cache.get(int(series_id)) or {"title": f"Series {series_id}", "tags": []}
+                if tagged_only and tag_id not in (serie.get("tags") or ()):
                     continue
 
                 # Format SxxExx if available
@@ -670,8 +1142,8 @@ def get_download_queue(tagged_only: bool = False) -> dict:
                     "episode": ep_label,
                     "status": item.get("status", "-"),
                     "protocol": item.get("protocol", "-"),
-                    "size": round(float(item.get("size", 0)) / (1024 ** 3), 2),
-                    "sizeleft": round(float(item.get("sizeleft", 0)) / (1024 ** 3), 2),
+                    "size": _gib(item.get("size")),
+                    "sizeleft": _gib(item.get("sizeleft")),
                     "timeleft": item.get("timeleft", "-"),
                     "indexer": item.get("indexer", "-"),
                     "downloadId": item.get("downloadId"),
@@ -694,27 +1166,19 @@ def get_eligible_items() -> dict:
     # Radarr
     try:
         if cfg.radarr.enabled:
-            rad = Radarr(cfg.radarr.base_url, cfg.radarr.api_key, cfg.api_path)
-            tag_id = rad.ensure_tag(cfg.tag_name)
-            q_scores = rad.quality_profiles_cutoff_scores()
-            movies = [m for m in rad.movies() if m.get("monitored") and m.get("movieFileId")]
-
-            def fetch_tuple(m: dict) -> Tuple[int, str, int, int, bool]:
-                mf = rad.movie_file(int(m["movieFileId"]))
-                score = int(mf.get("customFormatScore", 0))
-                cutoff = int(q_scores.get(int(m["qualityProfileId"]), 0))
-                tagged = tag_id in (m.get("tags", []) or [])
-                return int(m["id"]), str(m.get("title", "")), score, cutoff, tagged
-
-            for mid, title, score, cutoff, tagged in parallel_map(fetch_tuple, movies):
-                if score < cutoff and not tagged:
-                    out["radarr"].append({
-                        "id": mid,
-                        "title": title,
-                        "status": f"Score {score} / {cutoff}",
-                        "score": score,
-                        "cutoff": cutoff,
-                    })
+            rad = _get_radarr(cfg.radarr.base_url, cfg.radarr.api_key, cfg.api_path)
+            fetched = snapshot_radarr(rad, rad.ensure_tag(cfg.tag_name)).rows
+            out["radarr"] = [
+                {
+                    "id": mid,
+                    "title": title,
+                    "status": f"Score {score} / {cutoff}",
+                    "score": score,
+                    "cutoff": cutoff,
+                }
+                for mid, title, score, cutoff, tagged in fetched
+                if score < cutoff and not tagged
+            ]
     except Exception as e:
         logger.exception("Eligible Radarr fetch failed:")
         out["radarr_error"] = str(e)
@@ -722,20 +1186,19 @@ def get_eligible_items() -> dict:
     # Sonarr
     try:
         if cfg.sonarr.enabled:
-            son = Sonarr(cfg.sonarr.base_url, cfg.sonarr.api_key, cfg.api_path)
-            tag_id = son.ensure_tag(cfg.tag_name)
-            q_scores = son.quality_profiles_cutoff_scores()
-            series_list = son.series_list()
+            son = _get_sonarr(cfg.sonarr.base_url, cfg.sonarr.api_key, cfg.api_path)
+            snapshot = snapshot_sonarr(son, son.ensure_tag(cfg.tag_name))
+            tag_id, q_scores = snapshot.tag_id, snapshot.quality_scores
 
-            for serie in series_list:
-                if int(serie.get("statistics", {}).get("episodeFileCount", 0)) == 0:
-                    continue
-                series_tagged = tag_id in (serie.get("tags", []) or [])
-                if series_tagged:
-                    continue
+            eligible_series = [
+                serie for serie in snapshot.series
+                if int(serie.get("statistics", {}).get("episodeFileCount", 0)) > 0
+                and tag_id not in (serie.get("tags") or ())
+            ]
 
+            for serie, episode_files in fetch_series_episode_files(son, eligible_series):
                 cutoff = int(q_scores.get(int(serie.get("qualityProfileId")), 0))
-                for epf in son.episode_file_list(int(serie["id"])):
+                for epf in episode_files:
                     score = int(epf.get("customFormatScore", 0))
                     if score < cutoff:
                         out["sonarr"].append({
@@ -768,17 +1231,17 @@ def upgrade_single_item(target: str, item_id: int):
     """
     cfg = load_app_config()
     if target == "radarr":
-        rad = Radarr(cfg.radarr.base_url, cfg.radarr.api_key, cfg.api_path)
+        rad = _get_radarr(cfg.radarr.base_url, cfg.radarr.api_key, cfg.api_path)
         tag_id = rad.ensure_tag(cfg.tag_name)
         movie = rad.movie(int(item_id))
-        movie["tags"] = sorted(set(movie.get("tags", [])) | {tag_id})
+        add_tag(movie, tag_id)
         rad.update_movie(movie)
         rad.search_movies([int(item_id)])
         logger.info("Triggered upgrade for Radarr movie '%s' (id=%s)", movie.get("title"), item_id)
         return {"ok": True}
 
     if target == "sonarr":
-        son = Sonarr(cfg.sonarr.base_url, cfg.sonarr.api_key, cfg.api_path)
+        son = _get_sonarr(cfg.sonarr.base_url, cfg.sonarr.api_key, cfg.api_path)
         tag_id = son.ensure_tag(cfg.tag_name)
         episode = son.episode(int(item_id))
         # Sonarr can return list or single dict
@@ -788,7 +1251,7 @@ def upgrade_single_item(target: str, item_id: int):
         if not series_id:
             raise ValueError(f"No seriesId found for episode {item_id}")
         serie = son.series(series_id)
-        serie["tags"] = sorted(set(serie.get("tags", [])) | {tag_id})
+        add_tag(serie, tag_id)
         son.update_series(serie)
         son.search_episodes([int(item_id)])
         logger.info("Triggered upgrade for Sonarr episode id=%s (series '%s')", item_id, serie.get("title"))
@@ -805,7 +1268,7 @@ def force_upgrade_single_item(target: str, item_id: int):
     cfg = load_app_config()
 
     if target == "radarr":
-        rad = Radarr(cfg.radarr.base_url, cfg.radarr.api_key, cfg.api_path)
+        rad = _get_radarr(cfg.radarr.base_url, cfg.radarr.api_key, cfg.api_path)
         movie = rad.movie(int(item_id))
         file_id = movie.get("movieFileId")
         if file_id:
@@ -818,7 +1281,7 @@ def force_upgrade_single_item(target: str, item_id: int):
         return {"ok": True}
 
     if target == "sonarr":
-        son = Sonarr(cfg.sonarr.base_url, cfg.sonarr.api_key, cfg.api_path)
+        son = _get_sonarr(cfg.sonarr.base_url, cfg.sonarr.api_key, cfg.api_path)
         episode = son.episode(int(item_id))
         if isinstance(episode, list) and episode:
             episode = episode[0]
@@ -841,8 +1304,8 @@ def force_upgrade_single_item(target: str, item_id: int):
 def load_settings() -> dict:
     if os.path.exists(SETTINGS_FILE):
         try:
-            with open(SETTINGS_FILE, "r", encoding="utf-8") as f:
-                return json.load(f)
+            with open(SETTINGS_FILE, "rb") as f:
+                return orjson.loads(f.read())
         except Exception as e:
             logger.warning("Failed to load settings file %s: %s", SETTINGS_FILE, e)
     return {
@@ -858,8 +1321,12 @@ def load_settings() -> dict:
 def save_settings(cfg: dict):
     try:
         os.makedirs(os.path.dirname(SETTINGS_FILE), exist_ok=True)
-        with open(SETTINGS_FILE, "w", encoding="utf-8") as f:
-            json.dump(cfg, f, indent=2)
+        # Encode once, write once, then atomically swap so readers never see a partial file
+        data = orjson.dumps(cfg, option=orjson.OPT_INDENT_2)
+        tmp = SETTINGS_FILE + ".tmp"
+        with open(tmp, "wb") as f:
+            f.write(data)
+        os.replace(tmp, SETTINGS_FILE)
     except Exception as e:
         logger.error("Failed to save settings: %s", e)
         raise
@@ -870,15 +1337,17 @@ def save_settings(cfg: dict):
 # ------------------------------------------------------------
 def main() -> None:
     cfg = load_app_config()
-    try:
-        run_radarr_upgrade(cfg)
-    except Exception as e:
-        logger.exception("Radarr upgrade cycle failed:")
-
-    try:
-        run_sonarr_upgrade(cfg)
-    except Exception as e:
-        logger.exception("Sonarr upgrade cycle failed:")
+    # Radarr and Sonarr are independent servers: run both cycles concurrently
+    with ThreadPoolExecutor(max_workers=2, thread_name_prefix="cycle") as pool:
+        futures = {
+            pool.submit(run_radarr_upgrade, cfg): "Radarr",
+            pool.submit(run_sonarr_upgrade, cfg): "Sonarr",
+        }
+        for fut in as_completed(futures):
+            try:
+                fut.result()
+            except Exception:
+                logger.exception("%s upgrade cycle failed:", futures[fut])
 
 
 if __name__ == "__main__":
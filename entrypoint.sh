@@ -12,6 +12,7 @@ fi
 : "${TZ:=Etc/UTC}"
 : "${WEB_SERVICE_BIND:=0.0.0.0}"
 : "${WEB_SERVICE_PORT:=8998}"
+: "${FORWARDED_ALLOW_IPS:=127.0.0.1}"  # Proxies, deren X-Forwarded-For vertraut wird ('*' hebelt ALLOWED_IPS aus)
 : "${POLISHRR_TOKEN:?POLISHRR_TOKEN env var required}"
 
 echo "Starting Polishrr with schedule '${CRON_SCHEDULE}' and web port ${WEB_SERVICE_PORT}"
@@ -29,6 +30,14 @@ crontab /app/runtime/my-cron-job.actual
 cron
 echo "Cron started."
 
+# --- Shared snapshot cache: cron (root) and web service (polishrr) both write here
+: "${COLLECTION_CACHE_DIR=/app/runtime/cache}"
+if [ -n "${COLLECTION_CACHE_DIR}" ]; then
+  mkdir -p "${COLLECTION_CACHE_DIR}"
+  chown polishrr "${COLLECTION_CACHE_DIR}"
+  chmod 0777 "${COLLECTION_CACHE_DIR}"
+fi
+
 # --- Fix permissions (important for logging) ---
 chmod -R 777 /app/runtime
 
@@ -37,5 +46,5 @@ echo "Launching web service as 'polishrr'..."
 exec su -s /bin/bash polishrr -c "uvicorn web_service:app \
   --host ${WEB_SERVICE_BIND} \
   --port ${WEB_SERVICE_PORT} \
-  --proxy-headers --forwarded-allow-ips='*' \
+  --proxy-headers --forwarded-allow-ips='${FORWARDED_ALLOW_IPS}' \
   --log-level info"
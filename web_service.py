@@ -1,11 +1,15 @@
 # web_service.py
 import os, hmac, hashlib, asyncio, ipaddress, datetime as dt
 from typing import Optional, AsyncGenerator
+from concurrent.futures import ThreadPoolExecutor
 from fastapi import FastAPI, BackgroundTasks, Request, HTTPException, Depends, Body
-from fastapi.responses import PlainTextResponse, StreamingResponse, HTMLResponse
+from fastapi.responses import PlainTextResponse, HTMLResponse, Response, ORJSONResponse
 from fastapi.staticfiles import StaticFiles
 from pydantic import BaseModel
+from sse_starlette.sse import EventSourceResponse, ServerSentEvent
+import orjson
 import traceback
+import logging
 
 # Importiere deine bestehenden Upgrade-Funktionen aus app.py:
 from app import (
@@ -22,17 +26,44 @@ from app import (
     save_settings,
 )
 
-app = FastAPI(title="Polishrr Web Service", version="2.0")
+# Status/eligible/queue payloads can list the whole library; serialize them with orjson
+app = FastAPI(title="Polishrr Web Service", version="2.0", default_response_class=ORJSONResponse)
 
 POLISHRR_TOKEN = os.environ.get("POLISHRR_TOKEN", "")
 ALLOWED_IPS = [ip.strip() for ip in os.environ.get("ALLOWED_IPS", "").split(",") if ip.strip()]
 RUN_LOCK = asyncio.Lock()
+# Upgrade runs take minutes; keep them off the event loop and out of the shared default threadpool
+UPGRADE_POOL = ThreadPoolExecutor(max_workers=2, thread_name_prefix="upgrader")
 LAST_STATUS = {"started": None, "finished": None, "running": False, "last_result": None}
-EVENT_QUEUE: "asyncio.Queue[str]" = asyncio.Queue()
+# One bounded queue per connected SSE client; slow clients drop events instead of growing memory
+SUBSCRIBERS: "set[asyncio.Queue[ServerSentEvent]]" = set()
+SUBSCRIBER_QUEUE_SIZE = 64
+SSE_KEEPALIVE_SECONDS = 15
+
+def _broadcast(event: str, data: str) -> None:
+    msg = ServerSentEvent(data=data, event=event)
+    for q in SUBSCRIBERS:
+        try:
+            q.put_nowait(msg)
+        except asyncio.QueueFull:
+            pass
 
 def _ct_equals(a: str, b: str) -> bool:
     return hmac.compare_digest(a.encode(), b.encode())
 
+def _compile_allowed(entries):
+    nets, exact = [], set()
+    for entry in entries:
+        try:
+            nets.append(ipaddress.ip_network(entry, strict=False))
+        except ValueError:
+            exact.add(entry)
+    # Most specific first so single-host entries match without walking wide ranges
+    nets.sort(key=lambda n: n.prefixlen, reverse=True)
+    return nets, exact
+
+_ALLOWED_NETS, _ALLOWED_EXACT = _compile_allowed(ALLOWED_IPS)
+
 def _client_allowed(ip: str) -> bool:
     if not ALLOWED_IPS:
         return True
@@ -40,17 +71,11 @@ def _client_allowed(ip: str) -> bool:
         ip_addr = ipaddress.ip_address(ip)
     except ValueError:
         return False
-    for net in ALLOWED_IPS:
-        try:
-            if ip_addr in ipaddress.ip_network(net, strict=False):
-                return True
-        except ValueError:
-            if ip == net:
-                return True
-    return False
+    return ip in _ALLOWED_EXACT or any(ip_addr in net for net in _ALLOWED_NETS)
 
 async def _auth(request: Request):
-    client_ip = request.headers.get("x-forwarded-for", request.client.host)
+    # uvicorn --proxy-headers already resolves X-Forwarded-For from trusted proxies into client.host
+    client_ip = request.client.host if request.client else ""
     if not _client_allowed(client_ip):
         raise HTTPException(status_code=403, detail="Forbidden")
     auth = request.headers.get("authorization", "")
@@ -70,24 +95,25 @@ class TriggerBody(BaseModel):
 # Lauf- / Streaming-Logik (an neue API angepasst)
 # -----------------------------------------------------
 async def _run_and_stream(target: str):
-    await EVENT_QUEUE.put(f"event:info\ndata: run_start {target} {dt.datetime.utcnow().isoformat()}Z\n\n")
+    _broadcast("info", f"run_start {target} {dt.datetime.utcnow().isoformat()}Z")
     cfg = load_app_config()
+    loop = asyncio.get_running_loop()
 
     try:
         if target in ("radarr", "both"):
-            await EVENT_QUEUE.put("event:info\ndata: starting radarr\n\n")
-            run_radarr_upgrade(cfg)  # <-- Config wird jetzt übergeben
-            await EVENT_QUEUE.put("event:info\ndata: finished radarr\n\n")
+            _broadcast("info", "starting radarr")
+            await loop.run_in_executor(UPGRADE_POOL, run_radarr_upgrade, cfg)  # <-- Config wird jetzt übergeben
+            _broadcast("info", "finished radarr")
 
         if target in ("sonarr", "both"):
-            await EVENT_QUEUE.put("event:info\ndata: starting sonarr\n\n")
-            run_sonarr_upgrade(cfg)
-            await EVENT_QUEUE.put("event:info\ndata: finished sonarr\n\n")
+            _broadcast("info", "starting sonarr")
+            await loop.run_in_executor(UPGRADE_POOL, run_sonarr_upgrade, cfg)
+            _broadcast("info", "finished sonarr")
 
-        await EVENT_QUEUE.put("event:done\ndata: ok\n\n")
+        _broadcast("done", "ok")
         return {"ok": True}
     except Exception as e:
-        await EVENT_QUEUE.put(f"event:error\ndata: {type(e).__name__}: {e}\n\n")
+        _broadcast("error", f"{type(e).__name__}: {e}")
         return {"ok": False, "error": str(e)}
 
 
@@ -105,7 +131,7 @@ async def status(_: None = Depends(_auth)):
 
 @app.get("/api/upgrade-summary")
 async def upgrade_summary(_: None = Depends(_auth)):
-    return get_upgrade_status()
+    return await asyncio.to_thread(get_upgrade_status)
 
 @app.post("/api/trigger")
 async def trigger(body: TriggerBody, background: BackgroundTasks, request: Request, _: None = Depends(_auth)):
@@ -133,20 +159,24 @@ async def trigger(body: TriggerBody, background: BackgroundTasks, request: Reque
 
 
 @app.get("/api/events")
-async def events() -> StreamingResponse:
-    async def gen() -> AsyncGenerator[bytes, None]:
-        yield b": stream start\n\n"
-        while True:
-            msg = await EVENT_QUEUE.get()
-            yield msg.encode("utf-8")
+async def events() -> EventSourceResponse:
+    async def gen() -> AsyncGenerator[ServerSentEvent, None]:
+        q: "asyncio.Queue[ServerSentEvent]" = asyncio.Queue(maxsize=SUBSCRIBER_QUEUE_SIZE)
+        SUBSCRIBERS.add(q)
+        try:
+            yield ServerSentEvent(comment="stream start")
+            while True:
+                yield await q.get()
+        finally:
+            SUBSCRIBERS.discard(q)
 
-    headers = {"Cache-Control": "no-cache", "Connection": "keep-alive"}
-    return StreamingResponse(gen(), media_type="text/event-stream", headers=headers)
+    # ping keeps proxies from idling the stream out; disconnects end gen() via cancellation
+    return EventSourceResponse(gen(), ping=SSE_KEEPALIVE_SECONDS)
 
 
 @app.get("/api/eligible")
 async def eligible(_: None = Depends(_auth)):
-    return get_upgrade_status(detailed=True)
+    return await asyncio.to_thread(get_upgrade_status, detailed=True)
 
 @app.get("/api/recent-upgrades")
 async def recent_upgrades(_: None = Depends(_auth)):
@@ -155,8 +185,8 @@ async def recent_upgrades(_: None = Depends(_auth)):
 @app.get("/api/download-queue")
 async def download_queue(tagged: bool = False, eligible: bool = False, _: None = Depends(_auth)):
     if eligible:
-        return get_eligible_items()
-    return get_download_queue(tagged_only=tagged)
+        return await asyncio.to_thread(get_eligible_items)
+    return await asyncio.to_thread(get_download_queue, tagged_only=tagged)
 
 @app.post("/api/upgrade-item")
 async def upgrade_item(body: dict = Body(...), _: None = Depends(_auth)):
@@ -166,11 +196,10 @@ async def upgrade_item(body: dict = Body(...), _: None = Depends(_auth)):
         raise HTTPException(status_code=400, detail="Missing target or id")
 
     try:
-        result = upgrade_single_item(target, int(item_id))
+        result = await asyncio.to_thread(upgrade_single_item, target, int(item_id))
         return result
     except Exception as e:
-        import logging
-        logging.exception(f"❌ upgrade_item failed for {target} id={item_id}: {e}")
+        logging.exception("❌ upgrade_item failed for %s id=%s: %s", target, item_id, e)
         traceback.print_exc()
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -181,7 +210,7 @@ async def force_upgrade_item(body: dict = Body(...), _: None = Depends(_auth)):
     if not target or not item_id:
         raise HTTPException(status_code=400, detail="Missing target or id")
     try:
-        result = force_upgrade_single_item(target, int(item_id))
+        result = await asyncio.to_thread(force_upgrade_single_item, target, int(item_id))
         return result
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
@@ -192,7 +221,7 @@ async def get_settings(_: None = Depends(_auth)):
 
 @app.post("/api/settings")
 async def update_settings(request: Request, _: None = Depends(_auth)):
-    body = await request.json()
+    body = orjson.loads(await request.body())
     settings = load_settings()
     settings.update(body)
     save_settings(settings)
@@ -205,10 +234,20 @@ async def update_settings(request: Request, _: None = Depends(_auth)):
 app.mount("/static", StaticFiles(directory="/app/static"), name="static")
 app.mount("/assets", StaticFiles(directory="/app/assets"), name="assets")
 
-@app.get("/", response_class=HTMLResponse)
-async def root():
+def _load_status_page() -> bytes:
     try:
-        with open("/app/static/status.html", "r", encoding="utf-8") as f:
+        with open("/app/static/status.html", "rb") as f:
             return f.read()
     except FileNotFoundError:
-        return "<h1>Polishrr</h1><p>No static page found.</p>"
+        return "<h1>Polishrr</h1><p>No static page found.</p>".encode("utf-8")
+
+# The page ships with the image, so read it once instead of on every request
+_STATUS_HTML = _load_status_page()
+_STATUS_ETAG = '"%s"' % hashlib.md5(_STATUS_HTML).hexdigest()
+
+@app.get("/", response_class=HTMLResponse)
+async def root(request: Request):
+    headers = {"ETag": _STATUS_ETAG, "Cache-Control": "no-cache"}
+    if request.headers.get("if-none-match") == _STATUS_ETAG:
+        return Response(status_code=304, headers=headers)
+    return HTMLResponse(content=_STATUS_HTML, headers=headers)